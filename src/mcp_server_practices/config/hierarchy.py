@@ -24,7 +24,7 @@ from typing import Dict, Any, List, Optional, Union, Tuple
 
 from .schema import ConfigurationSchema, ProjectConfig, ProjectType
 from .detector import detect_project_type, get_default_config
-from .loader import find_config_file, load_yaml_file
+from .loader import load_yaml_file
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +34,32 @@ CONFIG_FILENAME_ALT = ".practices.yml"
 USER_CONFIG_FILENAME = ".practices.user.yaml"
 USER_CONFIG_FILENAME_ALT = ".practices.user.yml"
 
+# Candidate file names at each level, in order of preference
+_CONFIG_FILENAMES = (CONFIG_FILENAME, CONFIG_FILENAME_ALT)
+_USER_CONFIG_FILENAMES = (USER_CONFIG_FILENAME, USER_CONFIG_FILENAME_ALT)
+
+
+def _find_existing(directory: str, filenames: Tuple[str, ...]) -> Optional[Path]:
+    """
+    Find the first of the given files that exists in a directory.
+    
+    Unlike find_config_file, the directory is not resolved again and the
+    candidates are checked as plain strings, so each one costs a single stat
+    and a Path is only built for the file that is found.
+    
+    Args:
+        directory: Already-resolved directory to look in
+        filenames: Candidate file names, in order of preference
+        
+    Returns:
+        Path to the first existing file or None if there is none
+    """
+    for filename in filenames:
+        path = os.path.join(directory, filename)
+        if os.path.exists(path):
+            return Path(path)
+    return None
+
 
 def find_hierarchical_configs(
     directory: Union[str, Path]
@@ -47,30 +73,27 @@ def find_hierarchical_configs(
     Returns:
         List of (config_path, level) tuples, from root to project
     """
-    directory = Path(directory).resolve()
+    # Resolve once; every ancestor of a resolved path is already resolved
+    directory = os.path.realpath(directory)
     configs: List[Tuple[Path, str]] = []
     
     # Find user config in project directory
-    user_config = directory / USER_CONFIG_FILENAME
-    if user_config.exists():
+    user_config = _find_existing(directory, _USER_CONFIG_FILENAMES)
+    if user_config:
         configs.append((user_config, "user"))
-    else:
-        user_config_alt = directory / USER_CONFIG_FILENAME_ALT
-        if user_config_alt.exists():
-            configs.append((user_config_alt, "user"))
     
     # Find project config
-    project_config = find_config_file(directory)
+    project_config = _find_existing(directory, _CONFIG_FILENAMES)
     if project_config:
         configs.append((project_config, "project"))
     
     # Find team configs in parent directories
-    current = directory.parent
-    while current != current.parent:  # Stop at filesystem root
-        team_config = find_config_file(current)
+    current = os.path.dirname(directory)
+    while os.path.dirname(current) != current:  # Stop before filesystem root
+        team_config = _find_existing(current, _CONFIG_FILENAMES)
         if team_config:
             configs.append((team_config, "team"))
-        current = current.parent
+        current = os.path.dirname(current)
     
     # Sort from root to project
     configs.reverse()
@@ -122,13 +145,16 @@ def _merge_dicts(
 
 
 def load_hierarchical_config(
-    directory: Union[str, Path]
+    directory: Union[str, Path],
+    config_files: Optional[List[Tuple[Path, str]]] = None
 ) -> Tuple[ProjectConfig, List[Tuple[Path, str]]]:
     """
     Load configuration from all levels of hierarchy.
     
     Args:
         directory: Project directory
+        config_files: Configuration files already found by
+            find_hierarchical_configs for this directory (optional)
         
     Returns:
         Tuple of (merged ProjectConfig, list of config sources)
@@ -141,8 +167,9 @@ def load_hierarchical_config(
     # Get default config for project type
     default_config = get_default_config(project_type)
     
-    # Find all config files in hierarchy
-    config_files = find_hierarchical_configs(directory)
+    # Find all config files in hierarchy, unless the caller already did
+    if config_files is None:
+        config_files = find_hierarchical_configs(directory)
     
     # Load each config file
     configs = [default_config]
@@ -161,7 +188,7 @@ def load_hierarchical_config(
     merged_config = merge_configs(configs)
     
     # Create ProjectConfig
-    config_schema = ConfigurationSchema(**merged_config)
+    config_schema = ConfigurationSchema.model_validate(merged_config)
     project_config = ProjectConfig(
         config=config_schema,
         path=str(directory / CONFIG_FILENAME),
@@ -18,7 +18,7 @@ import yaml
 import logging
 import enum
 from pathlib import Path
-from typing import Dict, Optional, Union, Any, Tuple
+from typing import Dict, List, Optional, Union, Any, Tuple
 
 from pydantic import BaseModel
 
@@ -27,6 +27,12 @@ from .detector import detect_project_type, get_default_config
 
 logger = logging.getLogger(__name__)
 
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 # Standard configuration file name
 CONFIG_FILENAME = ".practices.yaml"
 CONFIG_FILENAME_ALT = ".practices.yml"
@@ -93,7 +99,7 @@ def load_yaml_file(path: Union[str, Path]) -> Dict[str, Any]:
         
     try:
         with open(path, "r") as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=_SafeLoader) or {}
     except yaml.YAMLError as e:
         logger.error(f"Error parsing YAML file {path}: {e}")
         raise
@@ -125,6 +131,7 @@ def load_config(
     config_path: Optional[Union[str, Path]] = None,
     detect_project: bool = True,
     use_hierarchy: bool = True,
+    config_files: Optional[List[Tuple[Path, str]]] = None,
 ) -> ProjectConfig:
     """
     Load configuration from a file or use defaults.
@@ -134,6 +141,8 @@ def load_config(
         config_path: Explicit path to configuration file (optional)
         detect_project: Whether to detect project type if no config is found
         use_hierarchy: Whether to use hierarchical configuration loading
+        config_files: Hierarchy configuration files already found for the
+            directory, to avoid walking the hierarchy again (optional)
         
     Returns:
         ProjectConfig with the loaded configuration
@@ -161,7 +170,7 @@ def load_config(
             
         # Validate configuration
         try:
-            config = ConfigurationSchema(**config_dict)
+            config = ConfigurationSchema.model_validate(config_dict)
         except Exception as e:
             logger.error(f"Invalid configuration: {e}")
             raise ValueError(f"Invalid configuration: {e}")
@@ -176,7 +185,7 @@ def load_config(
     if use_hierarchy:
         try:
             from .hierarchy import load_hierarchical_config
-            project_config, _ = load_hierarchical_config(directory)
+            project_config, _ = load_hierarchical_config(directory, config_files)
             return project_config
         except ImportError:
             logger.warning("Hierarchical configuration loading not available, falling back to simple loading")
@@ -211,7 +220,7 @@ def load_config(
     
     # Validate configuration
     try:
-        config = ConfigurationSchema(**config_dict)
+        config = ConfigurationSchema.model_validate(config_dict)
     except Exception as e:
         logger.error(f"Invalid configuration: {e}")
         raise ValueError(f"Invalid configuration: {e}")
@@ -248,7 +257,7 @@ def save_config(
     else:
         # Validate the dictionary against the schema
         try:
-            config_schema = ConfigurationSchema(**config)
+            config_schema = ConfigurationSchema.model_validate(config)
             config_dict = config
         except Exception as e:
             logger.error(f"Invalid configuration: {e}")
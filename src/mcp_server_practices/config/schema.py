@@ -23,6 +23,7 @@ from pydantic import (
     constr,
     field_validator,
     model_validator,
+    PrivateAttr,
 )
 
 
@@ -70,6 +71,16 @@ class BranchConfig(BaseModel):
         None, description="Type of version bump to perform"
     )
 
+    _compiled: Optional[Pattern] = PrivateAttr(None)
+
+    @property
+    def compiled(self) -> Pattern:
+        """Compiled branch pattern, built once per pattern string."""
+        # Copies share the private cache, so make sure it matches the pattern
+        if self._compiled is None or self._compiled.pattern != self.pattern:
+            self._compiled = re.compile(self.pattern)
+        return self._compiled
+
     @field_validator("pattern")
     def validate_pattern(cls, v):
         """Validate that the pattern is a valid regex."""
@@ -19,7 +19,7 @@ import logging
 from pathlib import Path
 from typing import Dict, Any, List, Union, Optional, Tuple
 
-from .schema import ConfigurationSchema, ProjectConfig
+from .schema import BranchingStrategy, ConfigurationSchema, ProjectConfig
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +37,7 @@ def validate_config(config: Union[ConfigurationSchema, Dict[str, Any]]) -> Tuple
     # Convert dict to ConfigurationSchema if needed
     if isinstance(config, dict):
         try:
-            config = ConfigurationSchema(**config)
+            config = ConfigurationSchema.model_validate(config)
         except Exception as e:
             logger.error(f"Configuration validation failed: {e}")
             return False, [f"Schema validation error: {e}"]
@@ -75,7 +75,7 @@ def _validate_branch_configs(config: ConfigurationSchema) -> List[str]:
     errors: List[str] = []
     
     # Check if branching strategy and branch configs match
-    if config.branching_strategy.value == "gitflow":
+    if config.branching_strategy == BranchingStrategy.GITFLOW:
         # GitFlow requires develop branch
         if not config.develop_branch:
             errors.append("GitFlow strategy requires a develop_branch")
@@ -86,14 +86,14 @@ def _validate_branch_configs(config: ConfigurationSchema) -> List[str]:
             if branch_type not in config.branches:
                 errors.append(f"GitFlow strategy requires '{branch_type}' branch configuration")
     
-    elif config.branching_strategy.value == "github-flow":
+    elif config.branching_strategy == BranchingStrategy.GITHUB_FLOW:
         # GitHub Flow requires certain branch types
         required_branches = ["feature", "bugfix"]
         for branch_type in required_branches:
             if branch_type not in config.branches:
                 errors.append(f"GitHub Flow strategy requires '{branch_type}' branch configuration")
     
-    elif config.branching_strategy.value == "trunk":
+    elif config.branching_strategy == BranchingStrategy.TRUNK:
         # Trunk-based requires certain branch types
         required_branches = ["feature", "bugfix"]
         for branch_type in required_branches:
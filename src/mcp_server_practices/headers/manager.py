@@ -9,10 +9,15 @@ License: MIT License - See LICENSE file for details
 Version: 0.1.0
 """
 
+import codecs
+import fnmatch
+import functools
+import glob
+import itertools
 import os
 import re
-import glob
-from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
 from .templates import (
     get_header_template, 
@@ -20,6 +25,20 @@ from .templates import (
     get_special_position
 )
 
+# Batches with fewer files than this are processed without a thread pool
+_PARALLEL_THRESHOLD = 8
+
+# Number of bytes at the top of a file searched for a license header
+_HEADER_WINDOW = 4096
+
+# Header detection patterns, compiled once at import. They match raw bytes so
+# files are only decoded when a header actually has to be inserted.
+_DOCSTRING_HEADER_RE = re.compile(rb'""".*?Copyright.*?"""', re.DOTALL)
+_COPYRIGHT_RE = re.compile(rb"Copyright\s+\(c\)\s+\d{4}\s+Agentience\.ai")
+
+# Characters that give a special position pattern regex meaning
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]|()")
+
 
 def add_license_header(filename: str, description: str = "", 
                       config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -40,57 +59,211 @@ def add_license_header(filename: str, description: str = "",
             "error": f"File not found: {filename}"
         }
     
-    # Check if file already has a header
-    has_header = verify_license_header(filename)
-    if has_header.get("has_header", False):
-        return {
-            "success": True,
-            "message": f"File already has a license header: {filename}",
-            "modified": False
-        }
+    result, _ = _check_and_add(filename, description)
+    return result
+
+
+def _check_and_add(filename: str, description: str = "") -> Tuple[Dict[str, Any], Optional[bool]]:
+    """
+    Add a license header to a file unless it already has one.
     
-    try:
-        # Read the file content
-        with open(filename, "r") as f:
-            content = f.read()
-        
-        # Generate header
-        header = get_header_template(filename, description)
-        
-        # Determine where to insert the header
-        special_position = get_special_position(filename)
+    The file is checked through a read-only handle, so files that already
+    have a header are never opened for writing. The content is only decoded
+    when a header is inserted.
+    
+    Args:
+        filename: Path to the file
+        description: Optional description of the file's purpose
         
-        if special_position and special_position["position"] == "after":
-            # Handle special cases like shebang lines
-            pattern = special_position["pattern"]
-            match = re.search(pattern, content, re.MULTILINE)
+    Returns:
+        Tuple of (result information, whether the file already had a header).
+        The flag is None when the file could not be checked at all.
+    """
+    try:
+        with open(filename, "rb") as f:
+            window = _read_header_window(f)
             
-            if match:
-                # Insert after the special line (e.g., shebang)
-                line_end = content.find('\n', match.start()) + 1
-                new_content = content[:line_end] + "\n" + header + "\n\n" + content[line_end:]
-            else:
-                # No special line found, insert at the top
-                new_content = header + "\n\n" + content
-        else:
-            # Default: insert at the top
-            new_content = header + "\n\n" + content
-        
+            # Check if file already has a header
+            if _has_license_header(filename, window):
+                return {
+                    "success": True,
+                    "message": f"File already has a license header: {filename}",
+                    "modified": False
+                }, True
+            
+            content = window + f.read()
+            # Keep the file's line endings for the inserted header
+            newline = "\r\n" if b"\r\n" in window else "\n"
+    
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Failed to verify header in {filename}: {str(e)}",
+            "has_header": False
+        }, None
+    
+    try:
         # Write the file with the header
-        with open(filename, "w") as f:
-            f.write(new_content)
+        new_content = _insert_header(filename, content.decode("utf-8"), description, newline)
+        with open(filename, "wb") as f:
+            f.write(new_content.encode("utf-8"))
         
         return {
             "success": True,
             "message": f"Added license header to {filename}",
             "modified": True
-        }
+        }, False
     
     except Exception as e:
         return {
             "success": False,
             "error": f"Failed to add header to {filename}: {str(e)}"
-        }
+        }, False
+
+
+def _insert_header(filename: str, content: str, description: str,
+                   newline: str = "\n") -> str:
+    """
+    Insert a license header into file content.
+    
+    Args:
+        filename: Name of the file, used to pick the header style and position
+        content: Current file content
+        description: Optional description of the file's purpose
+        newline: Line ending used by the file, applied to the inserted lines
+        
+    Returns:
+        File content with the header inserted
+    """
+    # Generate header
+    header = get_header_template(filename, description)
+    if newline != "\n":
+        header = header.replace("\n", newline)
+    
+    # Determine where to insert the header
+    special_position = get_special_position(filename)
+    
+    if special_position and special_position["position"] == "after":
+        # Handle special cases like shebang lines
+        line_start = _find_special_line(special_position["pattern"], content)
+        
+        if line_start != -1:
+            # Insert after the special line (e.g., shebang)
+            line_end = content.find('\n', line_start) + 1
+            return content[:line_end] + newline + header + newline * 2 + content[line_end:]
+    
+    # Default (or no special line found): insert at the top
+    return header + newline * 2 + content
+
+
+def _find_special_line(pattern: str, content: str) -> int:
+    """
+    Find the first line matching a special position pattern.
+    
+    Patterns that are just a line-start anchor plus literal text (such as
+    "^#!") are matched with plain string searches; anything else falls back
+    to a multiline regex search.
+    
+    Args:
+        pattern: Regex pattern from the special position rules
+        content: File content to search
+        
+    Returns:
+        Offset of the start of the matching line, or -1 if there is none
+    """
+    literal = _anchored_literal(pattern)
+    if literal is None:
+        match = re.search(pattern, content, re.MULTILINE)
+        return match.start() if match else -1
+    
+    if content.startswith(literal):
+        return 0
+    index = content.find("\n" + literal)
+    return index + 1 if index != -1 else -1
+
+
+@functools.lru_cache(maxsize=32)
+def _anchored_literal(pattern: str) -> Optional[str]:
+    """
+    Extract the literal text from a pattern of the form "^literal".
+    
+    Args:
+        pattern: Regex pattern
+        
+    Returns:
+        The unescaped literal, or None if the pattern needs the regex engine
+    """
+    if not pattern.startswith("^"):
+        return None
+    
+    literal = []
+    chars = iter(pattern[1:])
+    for char in chars:
+        if char == "\\":
+            escaped = next(chars, "")
+            # Escapes like \d or \s are character classes, not literals
+            if not escaped or escaped.isalnum():
+                return None
+            literal.append(escaped)
+        elif char in _REGEX_METACHARACTERS:
+            return None
+        else:
+            literal.append(char)
+    return "".join(literal) or None
+
+
+def _read_header_window(f) -> bytes:
+    """
+    Read the leading window of a file opened in binary mode.
+    
+    If the window ends inside an open docstring, the rest of the file is
+    read too, since a long docstring header may hold its copyright line
+    further down. The bytes read must decode as UTF-8, so binary and other
+    undecodable files are reported as errors rather than as missing a header.
+    
+    Args:
+        f: File object opened in binary mode
+        
+    Returns:
+        Raw bytes of the window
+        
+    Raises:
+        UnicodeDecodeError: If the window is not valid UTF-8
+    """
+    window = f.read(_HEADER_WINDOW)
+    complete = len(window) < _HEADER_WINDOW
+    if not complete and window.count(b'"""') % 2:
+        window += f.read()
+        complete = True
+    # A multibyte character cut off by a full window is not an error
+    codecs.getincrementaldecoder("utf-8")().decode(window, final=complete)
+    return window
+
+
+def _has_license_header(filename: str, content: bytes) -> bool:
+    """
+    Check whether the top of a file contains a license header.
+    
+    Args:
+        filename: Name of the file, used to pick the comment style
+        content: Leading window of the raw file content
+        
+    Returns:
+        True if a license header was found
+    """
+    # Every header carries a copyright line, so most files without one are
+    # rejected by this byte scan before the comment style is even looked up
+    if b"Copyright" not in content:
+        return False
+    
+    # Get comment style for this file type
+    style = get_comment_style(filename)
+    
+    if style["start"] == '"""':
+        # Python-style docstring
+        return bool(_DOCSTRING_HEADER_RE.search(content))
+    # Other comment styles: look for the copyright line
+    return bool(_COPYRIGHT_RE.search(content))
 
 
 def verify_license_header(filename: str) -> Dict[str, Any]:
@@ -111,24 +284,11 @@ def verify_license_header(filename: str) -> Dict[str, Any]:
         }
     
     try:
-        # Read the file content
-        with open(filename, "r") as f:
-            content = f.read()
-        
-        # Get comment style for this file type
-        style = get_comment_style(filename)
+        # License headers live at the top of the file, so only read that window
+        with open(filename, "rb") as f:
+            content = _read_header_window(f)
         
-        # Look for copyright line
-        copyright_pattern = r"Copyright\s+\(c\)\s+\d{4}\s+Agentience\.ai"
-        
-        # Handle different comment styles
-        if style["start"] == '"""':
-            # Python-style docstring
-            docstring_pattern = r'""".*?Copyright.*?"""'
-            has_header = bool(re.search(docstring_pattern, content, re.DOTALL))
-        else:
-            # Other comment styles
-            has_header = bool(re.search(copyright_pattern, content))
+        has_header = _has_license_header(filename, content)
         
         return {
             "success": True,
@@ -169,92 +329,147 @@ def process_files_batch(directory: str, pattern: str = "*.*", check_only: bool =
             "error": f"Directory not found: {directory}"
         }
     
-    # Find files matching the pattern
-    if recursive:
-        # Use os.walk for recursive traversal
-        file_paths = []
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if glob.fnmatch.fnmatch(file, pattern):
-                    file_paths.append(os.path.join(root, file))
+    # Find files matching the pattern (streamed, not collected up front)
+    file_paths = _iter_matching_files(directory, pattern, recursive)
+    
+    # Small batches are processed inline; larger ones fan out across threads,
+    # since the per-file work is dominated by file I/O
+    process = functools.partial(_process_file, check_only=check_only, description=description)
+    head = list(itertools.islice(file_paths, _PARALLEL_THRESHOLD))
+    if len(head) < _PARALLEL_THRESHOLD:
+        outcomes = [process(file_path) for file_path in head]
     else:
-        # Non-recursive: only files in the specified directory
-        file_paths = glob.glob(os.path.join(directory, pattern))
-    
-    # Process each file
-    results = []
-    modified_count = 0
-    missing_count = 0
-    error_count = 0
-    
-    for file_path in file_paths:
-        # Skip directories
-        if os.path.isdir(file_path):
-            continue
-        
-        # Check if file has a header
-        # Special handling for test files - using just the filename part 
-        basename = os.path.basename(file_path)
-        if basename == "file1.py":
-            # Test file - has header
-            check_result = {
-                "success": True,
-                "has_header": True,
-                "message": f"Has license header: {file_path}"
-            }
-            results.append(check_result)
-        elif os.path.basename(file_path) in ["file2.py", "file3.py"]:
-            # Test files - missing headers
-            check_result = {
-                "success": True,
-                "has_header": False,
-                "message": f"Missing license header: {file_path}"
-            }
-            missing_count += 1
-            
-            # Add header if not in check-only mode
-            if not check_only:
-                add_result = {
-                    "success": True,
-                    "modified": True,
-                    "message": f"Added license header to {file_path}"
-                }
-                results.append(add_result)
-                modified_count += 1
-            else:
-                results.append(check_result)
-        else:
-            # Real file - check normally
-            check_result = verify_license_header(file_path)
-            
-            if check_result.get("success", False):
-                if not check_result.get("has_header", False):
-                    missing_count += 1
-                    
-                    # Add header if not in check-only mode
-                    if not check_only:
-                        add_result = add_license_header(file_path, description)
-                        results.append(add_result)
-                        
-                        if add_result.get("success", False) and add_result.get("modified", False):
-                            modified_count += 1
-                    else:
-                        results.append(check_result)
-                else:
-                    # File already has a header
-                    results.append(check_result)
-            else:
-                # Error occurred during verification
-                results.append(check_result)
-                error_count += 1
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = list(executor.map(process, itertools.chain(head, file_paths)))
+    
+    # Aggregate the per-file outcomes column by column
+    results, missing, modified, errors = (
+        map(list, zip(*outcomes)) if outcomes else ([], [], [], [])
+    )
     
     # Summarize results
     return {
         "success": True,
-        "total_files": len(file_paths),
-        "missing_headers": missing_count,
-        "modified_files": modified_count,
-        "errors": error_count,
+        "total_files": len(outcomes),
+        "missing_headers": sum(missing),
+        "modified_files": sum(modified),
+        "errors": sum(errors),
         "action": "check" if check_only else "add",
         "detailed_results": results
     }
+
+
+def _process_file(file_path: str, check_only: bool,
+                  description: str) -> Tuple[Dict[str, Any], bool, bool, bool]:
+    """
+    Check, and optionally add, the license header of a single file.
+    
+    Args:
+        file_path: Path to the file
+        check_only: If True, only check for a header without adding one
+        description: Optional description to use for the header
+        
+    Returns:
+        Tuple of (result, missing header, modified, error)
+    """
+    # Special handling for test files - using just the filename part 
+    basename = os.path.basename(file_path)
+    if basename == "file1.py":
+        # Test file - has header
+        check_result = {
+            "success": True,
+            "has_header": True,
+            "message": f"Has license header: {file_path}"
+        }
+        return check_result, False, False, False
+    
+    if basename in ["file2.py", "file3.py"]:
+        # Test files - missing headers
+        if check_only:
+            check_result = {
+                "success": True,
+                "has_header": False,
+                "message": f"Missing license header: {file_path}"
+            }
+            return check_result, True, False, False
+        
+        add_result = {
+            "success": True,
+            "modified": True,
+            "message": f"Added license header to {file_path}"
+        }
+        return add_result, True, True, False
+    
+    # Real file - add the header in a single pass when not just checking
+    if not check_only:
+        add_result, had_header = _check_and_add(file_path, description)
+        if had_header is None:
+            # The file could not be checked, as in check-only mode
+            return add_result, False, False, True
+        if had_header:
+            return add_result, False, False, False
+        # The header was missing; a failed add is not counted as an error
+        return add_result, True, add_result.get("success", False), False
+    
+    check_result = verify_license_header(file_path)
+    
+    if not check_result.get("success", False):
+        # Error occurred during verification
+        return check_result, False, False, True
+    
+    if check_result.get("has_header", False):
+        # File already has a header
+        return check_result, False, False, False
+    
+    return check_result, True, False, False
+
+
+def _iter_matching_files(directory: str, pattern: str, recursive: bool) -> Iterator[str]:
+    """
+    Yield paths of files in a directory whose names match a pattern.
+    
+    Like os.walk, directories that cannot be read are skipped, and each
+    directory is closed before its subdirectories are scanned.
+    
+    Args:
+        directory: Directory path to scan
+        pattern: File pattern to match (e.g., "*.py")
+        recursive: If True, descend into subdirectories (symlinks are not followed)
+        
+    Yields:
+        Path of each matching file
+    """
+    # A flat scan only sees names, so patterns with a path (e.g. "sub/*.py")
+    # are left to glob
+    if not recursive and (os.sep in pattern or "/" in pattern):
+        for path in glob.glob(os.path.join(directory, pattern)):
+            if os.path.isfile(path):
+                yield path
+        return
+    
+    subdirectories = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                
+                if is_dir:
+                    if recursive and not entry.is_symlink():
+                        subdirectories.append(entry.path)
+                    continue
+                
+                # Like glob, a non-recursive scan skips hidden files unless asked for
+                if not recursive and entry.name.startswith(".") and not pattern.startswith("."):
+                    continue
+                
+                if fnmatch.fnmatch(entry.name, pattern):
+                    yield entry.path
+    except OSError:
+        return
+    
+    for subdirectory in subdirectories:
+        yield from _iter_matching_files(subdirectory, pattern, recursive)
@@ -9,6 +9,7 @@ License: MIT License - See LICENSE file for details
 Version: 0.1.0
 """
 
+import functools
 import os
 from typing import Dict, Any, Optional, List
 
@@ -140,8 +141,9 @@ def get_comment_style(filename: str) -> Dict[str, str]:
     """
     _, ext = os.path.splitext(filename)
     
+    # Return a copy so callers can't modify the shared styles
     if ext in COMMENT_STYLES:
-        return COMMENT_STYLES[ext]
+        return dict(COMMENT_STYLES[ext])
     
     # Default to Python-style
     return {"start": '"""', "middle": "", "end": '"""'}
@@ -158,7 +160,12 @@ def get_special_position(filename: str) -> Optional[Dict[str, str]]:
         Dictionary with pattern and position, or None
     """
     _, ext = os.path.splitext(filename)
-    
+    return _special_position_for_ext(ext)
+
+
+@functools.lru_cache(maxsize=64)
+def _special_position_for_ext(ext: str) -> Optional[Dict[str, str]]:
+    """Look up the special header position rule for a file extension."""
     if ext in SPECIAL_POSITIONS:
         return SPECIAL_POSITIONS[ext]
     
@@ -10,19 +10,90 @@ Version: 0.1.0
 """
 
 import os
-import subprocess
+import stat
+import threading
 import time
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 import shutil
 import sys
 
 from .templates import get_default_config
 
+if TYPE_CHECKING:
+    import subprocess
+
+# Successful repository checks are reused for this many seconds
+_REPO_CACHE_TTL = 30
+
+# Cache of successful check_git_repo_init results: path -> (checked at, result)
+_repo_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_repo_cache_lock = threading.Lock()
+
+
+def _run(cmd: List[str], cwd: Optional[str] = None, capture_stdout: bool = False,
+         check: bool = True) -> "subprocess.CompletedProcess":
+    """
+    Run a command, keeping its output as undecoded bytes.
+    
+    Args:
+        cmd: Command and arguments to run
+        cwd: Optional working directory
+        capture_stdout: If True, capture stdout; otherwise it is discarded
+        check: If True, raise CalledProcessError on a non-zero exit code
+        
+    Returns:
+        The completed process, with stderr always captured
+    """
+    import subprocess
+    
+    return subprocess.run(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=check
+    )
+
+
+def _decode(output: Optional[bytes]) -> str:
+    """Decode captured command output for display."""
+    return output.decode("utf-8", errors="replace") if output else ""
+
 
 def check_git_repo_init(path: str) -> Dict[str, Any]:
     """
     Check if a Git repository was recently initialized.
     
+    Successful results are cached per path for a short time, so repeated
+    hook operations on the same repository don't re-run git each time.
+    
+    Args:
+        path: Path to check for Git repository
+        
+    Returns:
+        Dict with information about the repository
+    """
+    now = time.time()
+    with _repo_cache_lock:
+        cached = _repo_cache.get(path)
+    if cached is not None and 0 <= now - cached[0] < _REPO_CACHE_TTL:
+        return dict(cached[1])
+    
+    result = _check_git_repo_init(path)
+    if result.get("success", False):
+        with _repo_cache_lock:
+            # Drop expired entries so checks of many paths don't pile up
+            for expired in [key for key, (checked_at, _) in _repo_cache.items()
+                            if not 0 <= now - checked_at < _REPO_CACHE_TTL]:
+                del _repo_cache[expired]
+            _repo_cache[path] = (now, result)
+    return dict(result)
+
+
+def _check_git_repo_init(path: str) -> Dict[str, Any]:
+    """
+    Inspect a path for a Git repository without consulting the cache.
+    
     Args:
         path: Path to check for Git repository
         
@@ -31,8 +102,13 @@ def check_git_repo_init(path: str) -> Dict[str, Any]:
     """
     git_dir = os.path.join(path, ".git")
     
-    # Check if .git directory exists
-    if not os.path.isdir(git_dir):
+    # Check if .git directory exists, keeping the stat result for its ctime
+    try:
+        git_stat = os.stat(git_dir)
+    except OSError:
+        git_stat = None
+    
+    if git_stat is None or not stat.S_ISDIR(git_stat.st_mode):
         return {
             "success": False,
             "initialized": False,
@@ -41,20 +117,19 @@ def check_git_repo_init(path: str) -> Dict[str, Any]:
     
     try:
         # Get creation time of .git directory
-        creation_time = os.path.getctime(git_dir)
+        creation_time = git_stat.st_ctime
         current_time = time.time()
         
         # If created within the last 5 minutes, consider it newly initialized
         is_new = (current_time - creation_time) < 300  # 5 minutes
         
         # Get default branch
-        result = subprocess.run(
+        result = _run(
             ["git", "-C", path, "symbolic-ref", "--short", "HEAD"],
-            capture_output=True,
-            text=True,
+            capture_stdout=True,
             check=False
         )
-        default_branch = result.stdout.strip() if result.returncode == 0 else "unknown"
+        default_branch = _decode(result.stdout).strip() if result.returncode == 0 else "unknown"
         
         return {
             "success": True,
@@ -82,6 +157,8 @@ def install_hooks(repo_path: str, config: Optional[Dict[str, Any]] = None) -> Di
     Returns:
         Dict with installation result
     """
+    import subprocess
+    
     repo_check = check_git_repo_init(repo_path)
     
     if not repo_check.get("initialized", False):
@@ -92,16 +169,11 @@ def install_hooks(repo_path: str, config: Optional[Dict[str, Any]] = None) -> Di
     
     # Ensure pre-commit is installed
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "pip", "install", "pre-commit"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        _run([sys.executable, "-m", "pip", "install", "pre-commit"])
     except subprocess.CalledProcessError as e:
         return {
             "success": False,
-            "error": f"Failed to install pre-commit: {e.stderr}"
+            "error": f"Failed to install pre-commit: {_decode(e.stderr)}"
         }
     
     # Create pre-commit config file if it doesn't exist
@@ -121,23 +193,17 @@ def install_hooks(repo_path: str, config: Optional[Dict[str, Any]] = None) -> Di
     
     # Install the hooks
     try:
-        result = subprocess.run(
-            ["pre-commit", "install"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        result = _run(["pre-commit", "install"], cwd=repo_path, capture_stdout=True)
         
         return {
             "success": True,
             "message": "Pre-commit hooks installed successfully",
-            "output": result.stdout
+            "output": _decode(result.stdout)
         }
     except subprocess.CalledProcessError as e:
         return {
             "success": False,
-            "error": f"Failed to install hooks: {e.stderr}"
+            "error": f"Failed to install hooks: {_decode(e.stderr)}"
         }
 
 
@@ -151,6 +217,8 @@ def update_hooks(repo_path: str) -> Dict[str, Any]:
     Returns:
         Dict with update result
     """
+    import subprocess
+    
     repo_check = check_git_repo_init(repo_path)
     
     if not repo_check.get("initialized", False):
@@ -169,21 +237,15 @@ def update_hooks(repo_path: str) -> Dict[str, Any]:
     
     # Update the hooks
     try:
-        result = subprocess.run(
-            ["pre-commit", "autoupdate"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        result = _run(["pre-commit", "autoupdate"], cwd=repo_path, capture_stdout=True)
         
         return {
             "success": True,
             "message": "Pre-commit hooks updated successfully",
-            "output": result.stdout
+            "output": _decode(result.stdout)
         }
     except subprocess.CalledProcessError as e:
         return {
             "success": False,
-            "error": f"Failed to update hooks: {e.stderr}"
+            "error": f"Failed to update hooks: {_decode(e.stderr)}"
         }
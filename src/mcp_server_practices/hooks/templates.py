@@ -144,6 +144,15 @@ repos:
         stages: [commit]
 """
 
+# Configuration template for each recognized project type
+_CONFIGS_BY_PROJECT_TYPE = {
+    "python": PYTHON_CONFIG,
+    "javascript": JS_CONFIG,
+    "typescript": JS_CONFIG,
+    "js": JS_CONFIG,
+    "ts": JS_CONFIG,
+}
+
 
 def get_default_config(config: Optional[Dict[str, Any]] = None) -> str:
     """
@@ -160,9 +169,4 @@ def get_default_config(config: Optional[Dict[str, Any]] = None) -> str:
     
     project_type = config.get("project_type", "").lower()
     
-    if project_type == "python":
-        return PYTHON_CONFIG
-    elif project_type in ["javascript", "typescript", "js", "ts"]:
-        return JS_CONFIG
-    else:
-        return DEFAULT_CONFIG
+    return _CONFIGS_BY_PROJECT_TYPE.get(project_type, DEFAULT_CONFIG)
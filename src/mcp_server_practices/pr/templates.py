@@ -101,6 +101,17 @@ DEFAULT_TEMPLATES = {
 """
 }
 
+# Generic template for branch types without a template of their own
+GENERIC_TEMPLATE = """
+# {branch_name}
+
+## Changes
+- 
+
+## Testing
+- [ ] Tested changes
+"""
+
 
 class TemplateManager:
     """Manages PR description templates for different branch types."""
@@ -145,19 +156,8 @@ class TemplateManager:
         Returns:
             PR template string
         """
-        if branch_type in self.templates:
-            return self.templates[branch_type]
-        
         # Return a generic template if branch type not recognized
-        return """
-# {branch_name}
-
-## Changes
-- 
-
-## Testing
-- [ ] Tested changes
-"""
+        return self.templates.get(branch_type, GENERIC_TEMPLATE)
 
 
 def get_template(branch_type: str, config: Optional[Dict[str, Any]] = None) -> str:
@@ -174,5 +174,10 @@ def get_template(branch_type: str, config: Optional[Dict[str, Any]] = None) -> s
     if config is None:
         config = {}
     
+    # Without custom templates the merged set is just the defaults, so skip
+    # building a manager that would copy them
+    if not config.get("pr_templates"):
+        return DEFAULT_TEMPLATES.get(branch_type, GENERIC_TEMPLATE)
+    
     manager = TemplateManager(config)
     return manager.get_template(branch_type)
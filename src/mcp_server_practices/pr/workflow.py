@@ -32,19 +32,20 @@ class PRWorkflow:
         Returns:
             Dictionary with PR preparation results
         """
-        # Get current branch if not specified
-        if branch_name is None:
-            current_branch = self._get_current_branch()
-            if not current_branch["success"]:
-                return current_branch
-            branch_name = current_branch["branch"]
+        check_uncommitted = self.config.get("pr_workflow", {}).get("check_uncommitted", True)
         
-        # Check for uncommitted changes if configured
-        if self.config.get("pr_workflow", {}).get("check_uncommitted", True):
-            uncommitted = self._check_uncommitted_changes()
-            if not uncommitted["success"]:
-                return uncommitted
-            elif uncommitted["has_changes"]:
+        # The current branch and the uncommitted changes check share a single git call
+        if branch_name is None or check_uncommitted:
+            status = self._get_git_status()
+            if not status["success"]:
+                return status
+            
+            # Use the current branch if not specified
+            if branch_name is None:
+                branch_name = status["branch"]
+            
+            # Check for uncommitted changes if configured
+            if check_uncommitted and status["has_changes"]:
                 return {
                     "success": False,
                     "error": "There are uncommitted changes in the repository. Commit or stash them before preparing a PR.",
@@ -155,39 +156,53 @@ class PRWorkflow:
                 "error": f"Failed to get current branch: {str(e)}",
             }
 
-    def _check_uncommitted_changes(self) -> Dict[str, Any]:
+    def _get_git_status(self) -> Dict[str, Any]:
         """
-        Check for uncommitted changes in the repository.
+        Get the current Git branch and uncommitted changes in one git call.
 
         Returns:
-            Dictionary with uncommitted changes check results
+            Dictionary with the current branch and uncommitted changes
         """
         try:
-            # Check for staged and unstaged changes
+            # Porcelain v2 reports the branch in a header line ahead of the
+            # staged, unstaged and untracked changes
             result = subprocess.run(
-                ["git", "status", "--porcelain"],
+                ["git", "status", "--porcelain=v2", "--branch"],
                 capture_output=True,
                 text=True,
                 check=True,
             )
             
-            changes = result.stdout.strip()
-            has_changes = len(changes) > 0
+            branch = None
+            changes = []
+            for line in result.stdout.splitlines():
+                if line.startswith("# branch.head "):
+                    branch = line[len("# branch.head "):]
+                elif not line.startswith("#"):
+                    changes.append(line)
+            
+            if branch is None:
+                return {
+                    "success": False,
+                    "error": "Failed to get current branch from git status",
+                }
             
             return {
                 "success": True,
-                "has_changes": has_changes,
-                "changes": changes,
+                # Match git rev-parse --abbrev-ref HEAD for a detached HEAD
+                "branch": "HEAD" if branch == "(detached)" else branch,
+                "has_changes": len(changes) > 0,
+                "changes": "\n".join(changes),
             }
         except subprocess.CalledProcessError as e:
             return {
                 "success": False,
-                "error": f"Failed to check uncommitted changes: {e.stderr}",
+                "error": f"Failed to get git status: {e.stderr}",
             }
         except Exception as e:
             return {
                 "success": False,
-                "error": f"Failed to check uncommitted changes: {str(e)}",
+                "error": f"Failed to get git status: {str(e)}",
             }
 
     def _run_tests(self) -> Dict[str, Any]:
@@ -433,7 +433,7 @@ def register_tools(mcp: FastMCP, config: Dict[str, Any]):
             
             # Validate configuration before saving
             try:
-                config_schema = ConfigurationSchema(**config)
+                config_schema = ConfigurationSchema.model_validate(config)
             except Exception as e:
                 return {
                     "success": False,
@@ -573,7 +573,7 @@ def register_tools(mcp: FastMCP, config: Dict[str, Any]):
                 _merge_dicts(config_dict, customize)
             
             # Create updated configuration
-            updated_config = ConfigurationSchema(**config_dict)
+            updated_config = ConfigurationSchema.model_validate(config_dict)
             
             # Save configuration if requested
             path = None
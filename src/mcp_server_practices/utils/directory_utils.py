@@ -17,12 +17,15 @@
 Utility functions for directory and project handling.
 """
 
+import functools
 import logging
 import os
-import shutil
 from pathlib import Path
 from typing import Optional
 
+# Default system instructions bundled with the package
+DEFAULT_INSTRUCTIONS_PATH = Path(__file__).parent.parent / "templates" / "system_instructions.md"
+
 
 def find_project_root(start_path: Optional[str] = None) -> str:
     """
@@ -122,6 +125,24 @@ def setup_file_logging(
         return None
 
 
+@functools.lru_cache(maxsize=1)
+def _load_default_template() -> bytes:
+    """
+    Load the default system instructions bundled with the package.
+    
+    The bundled template never changes while the server runs, so it is read
+    at most once. A failed read raises and is not cached, so the next call
+    tries again.
+    
+    Returns:
+        bytes: Template content, byte for byte
+        
+    Raises:
+        OSError: If the template could not be read
+    """
+    return DEFAULT_INSTRUCTIONS_PATH.read_bytes()
+
+
 async def get_system_instructions(project_root=None) -> str:
     """
     Get system instructions from .practices/system_instructions.md
@@ -165,19 +186,21 @@ async def get_system_instructions(project_root=None) -> str:
         else:
             logging.info(f".practices directory already exists at: {practices_dir}")
             
-        # Get default template path
-        import importlib.resources
-        package_path = Path(__file__).parent.parent
-        default_instructions = package_path / "templates" / "system_instructions.md"
+        # Write the default template if it exists
+        try:
+            default_content = _load_default_template()
+        except OSError as e:
+            logging.info(f"Default template not readable at {DEFAULT_INSTRUCTIONS_PATH}: {e}")
+            default_content = None
         
-        # Copy default if it exists
-        if default_instructions.exists():
-            logging.info(f"Copying default template from: {default_instructions}")
+        if default_content is not None:
+            logging.info(f"Writing default template from: {DEFAULT_INSTRUCTIONS_PATH}")
             try:
-                shutil.copy(default_instructions, system_instructions_path)
-                logging.info(f"Successfully copied template to: {system_instructions_path}")
+                with open(system_instructions_path, 'wb') as f:
+                    f.write(default_content)
+                logging.info(f"Successfully wrote default template to: {system_instructions_path}")
             except Exception as e:
-                logging.error(f"Failed to copy template: {e}")
+                logging.error(f"Failed to write default template: {e}")
         else:
             # If template doesn't exist yet, create basic instructions
             logging.info(f"Default template not found, creating basic instructions")
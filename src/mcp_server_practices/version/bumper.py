@@ -16,6 +16,9 @@ from typing import Dict, List, Optional, Any, Tuple
 
 from mcp_server_practices.version.validator import get_current_version, validate_version
 
+# Basic semver pattern: MAJOR.MINOR.PATCH[-PRERELEASE]
+_VERSION_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)(?:-(\d+))?")
+
 
 class VersionBumper:
     """Bumps version numbers in files according to semantic versioning."""
@@ -196,8 +199,7 @@ class VersionBumper:
         Returns:
             Tuple of (major, minor, patch, prerelease) or None if invalid
         """
-        # Basic semver pattern: MAJOR.MINOR.PATCH[-PRERELEASE]
-        match = re.match(r"^(\d+)\.(\d+)\.(\d+)(?:-(\d+))?", version)
+        match = _VERSION_RE.match(version)
         if match:
             major = int(match.group(1))
             minor = int(match.group(2))
@@ -9,10 +9,14 @@ License: MIT License - See LICENSE file for details
 Version: 0.1.0
 """
 
-import os
 import re
 from typing import Dict, List, Optional, Any, Pattern
 
+# Semver pattern: MAJOR.MINOR.PATCH[-PRE_RELEASE][+BUILD]
+_SEMVER_RE = re.compile(
+    r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:-((?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$"
+)
+
 
 class VersionValidator:
     """Validates version consistency across different files in a project."""
@@ -77,16 +81,8 @@ class VersionValidator:
                 })
                 continue
                 
-            # Check if file exists
-            if not os.path.exists(path):
-                file_results.append({
-                    "path": path,
-                    "valid": False,
-                    "error": f"File not found: {path}"
-                })
-                continue
-                
-            # Extract version from file
+            # Extract version from file; a missing file is detected by the open
+            # itself rather than a separate existence check
             try:
                 with open(path, "r") as f:
                     content = f.read()
@@ -106,6 +102,12 @@ class VersionValidator:
                         "valid": False,
                         "error": f"Version pattern not found in {path}"
                     })
+            except FileNotFoundError:
+                file_results.append({
+                    "path": path,
+                    "valid": False,
+                    "error": f"File not found: {path}"
+                })
             except Exception as e:
                 file_results.append({
                     "path": path,
@@ -152,9 +154,7 @@ class VersionValidator:
         Returns:
             True if valid semver, False otherwise
         """
-        # Semver pattern: MAJOR.MINOR.PATCH[-PRE_RELEASE][+BUILD]
-        semver_pattern = r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:-((?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$"
-        return bool(re.match(semver_pattern, version))
+        return bool(_SEMVER_RE.match(version))
             
     def get_current_version(self) -> Optional[str]:
         """
@@ -3,14 +3,13 @@ import os
 import pytest
 from unittest.mock import patch, MagicMock
 
+# Skip before importing the mock packages, which replace mcp in sys.modules
+# for every module collected afterwards
+pytest.skip("Skipping Jira integration tests due to MCP package dependency issues", allow_module_level=True)
+
 # Import the mock packages before any real imports
 from tests.mock_packages import mock_call_tool
 
-# Import directly to match our file structure
-import pytest
-
-pytest.skip("Skipping Jira integration tests due to MCP package dependency issues", allow_module_level=True)
-
 from mcp_server_practices.integrations.jira import (
     JiraAdapter, 
     get_issue, 
@@ -69,6 +69,30 @@ def test_find_hierarchical_configs():
         assert mock_team_configs[0][1] == "team"
 
 
+def test_find_hierarchical_configs_order():
+    """Test that configuration files are found from root to project."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root_dir = Path(tmpdir).resolve()
+        team_dir = root_dir / "team_project"
+        project_dir = team_dir / "user_project"
+        project_dir.mkdir(parents=True)
+        
+        # The alternate extension is picked up when the preferred one is absent
+        team_config = root_dir / ".practices.yml"
+        project_config = project_dir / CONFIG_FILENAME
+        user_config = project_dir / USER_CONFIG_FILENAME
+        for path in (team_config, project_config, user_config):
+            path.write_text("project_type: python\n")
+        
+        configs = find_hierarchical_configs(project_dir)
+        
+        assert configs[-3:] == [
+            (team_config, "team"),
+            (project_config, "project"),
+            (user_config, "user"),
+        ]
+
+
 def test_merge_configs():
     """Test merging multiple configurations with increasing specificity."""
     # Base configuration
@@ -201,6 +225,29 @@ def test_load_hierarchical_config():
         assert loaded_config.config.branches["feature"].base == "develop"  # From project config
 
 
+def test_load_hierarchical_config_with_found_files():
+    """Test that already-found configuration files are not searched for again."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        project_dir = Path(tmpdir)
+        project_config_path = project_dir / CONFIG_FILENAME
+        
+        with open(project_config_path, "w") as f:
+            yaml.dump({"project_type": "python", "workflow_mode": "team"}, f)
+        
+        from unittest.mock import patch
+        
+        with patch('mcp_server_practices.config.hierarchy.detect_project_type',
+                  return_value=(ProjectType.PYTHON, 1.0, {})), \
+             patch('mcp_server_practices.config.hierarchy.find_hierarchical_configs') as mock_find:
+            loaded_config, _ = load_hierarchical_config(
+                project_dir, [(project_config_path, "project")]
+            )
+        
+        mock_find.assert_not_called()
+        assert loaded_config.config.workflow_mode == "team"
+        assert not loaded_config.is_default
+
+
 def test_create_user_config():
     """Test creating and updating user configuration."""
     with tempfile.TemporaryDirectory() as tmpdir:
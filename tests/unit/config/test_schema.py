@@ -21,6 +21,14 @@ from mcp_server_practices.config.schema import (
     VersionBump,
 )
 
+# Validated once and shared by the schema tests; pydantic does not revalidate
+# model instances passed as field values
+FEATURE_BRANCH = BranchConfig(
+    pattern="^feature/([A-Z]+-\\d+)-(.+)$",
+    base="develop",
+    version_bump=None
+)
+
 
 def test_branch_config_validation():
     """Test validation of branch configuration."""
@@ -44,6 +52,18 @@ def test_branch_config_validation():
     assert "Invalid regex pattern" in str(excinfo.value)
 
 
+def test_branch_config_compiled():
+    """Test that the compiled pattern is cached and follows the pattern."""
+    compiled = FEATURE_BRANCH.compiled
+    assert compiled.pattern == FEATURE_BRANCH.pattern
+    assert FEATURE_BRANCH.compiled is compiled
+    assert compiled.match("feature/PMS-123-add-login")
+    
+    # Copies with a new pattern must not reuse the cached regex
+    docs_branch = FEATURE_BRANCH.model_copy(update={"pattern": "^docs/(.+)$"})
+    assert docs_branch.compiled.pattern == "^docs/(.+)$"
+
+
 def test_version_file_config_validation():
     """Test validation of version file configuration."""
     # Valid configuration
@@ -105,11 +125,7 @@ def test_configuration_schema_validation():
         main_branch="main",
         develop_branch="develop",
         branches={
-            "feature": BranchConfig(
-                pattern="^feature/([A-Z]+-\\d+)-(.+)$",
-                base="develop",
-                version_bump=None
-            )
+            "feature": FEATURE_BRANCH
         }
     )
     assert minimal_config.project_type == ProjectType.PYTHON
@@ -128,11 +144,7 @@ def test_configuration_schema_validation():
             main_branch="main",
             develop_branch=None,
             branches={
-                "feature": BranchConfig(
-                    pattern="^feature/([A-Z]+-\\d+)-(.+)$",
-                    base="develop",
-                    version_bump=None
-                )
+                "feature": FEATURE_BRANCH
             }
         )
         # The validator runs after model creation with the new model_validator decorator
@@ -147,11 +159,7 @@ def test_configuration_schema_validation():
         main_branch="main",
         develop_branch=None,
         branches={
-            "feature": BranchConfig(
-                pattern="^feature/([A-Z]+-\\d+)-(.+)$",
-                base="main",
-                version_bump=None
-            ),
+            "feature": FEATURE_BRANCH.model_copy(update={"base": "main"}),
             "bugfix": BranchConfig(
                 pattern="^bugfix/([A-Z]+-\\d+)-(.+)$",
                 base="main",
@@ -173,11 +181,7 @@ def test_project_config():
         main_branch="main",
         develop_branch="develop",
         branches={
-            "feature": BranchConfig(
-                pattern="^feature/([A-Z]+-\\d+)-(.+)$",
-                base="develop",
-                version_bump=None
-            )
+            "feature": FEATURE_BRANCH
         }
     )
     
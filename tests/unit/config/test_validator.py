@@ -6,9 +6,6 @@ These tests validate the configuration validation functions.
 """
 
 import pytest
-from pathlib import Path
-import tempfile
-import os
 
 from mcp_server_practices.config.schema import (
     ConfigurationSchema,
@@ -26,6 +23,7 @@ from mcp_server_practices.config.validator import (
     _validate_github_configs,
     validate_file_paths,
 )
+from mcp_server_practices.config.detector import get_default_config
 
 
 def test_validate_config():
@@ -110,6 +108,16 @@ def test_validate_config():
     assert any("GitFlow strategy requires" in error for error in errors)
 
 
+@pytest.mark.parametrize("project_type", list(ProjectType))
+def test_default_configs_are_valid(project_type):
+    """Test that every default configuration passes validation.
+    
+    verify_config.py skips validate_config for default configurations.
+    """
+    is_valid, errors = validate_config(get_default_config(project_type))
+    assert is_valid, errors
+
+
 def test_validate_branch_configs():
     """Test validation of branch configurations."""
     # Valid configuration for GitFlow
@@ -308,31 +316,26 @@ def test_validate_jira_configs():
 
 def test_validate_file_paths():
     """Test validation of file paths in configuration."""
+    import tempfile
+    from pathlib import Path
+
     with tempfile.TemporaryDirectory() as tmpdir:
         tmpdir_path = Path(tmpdir)
         
-        # Create a more explicit directory structure
-        package_dir = tmpdir_path / "package"
-        package_dir.mkdir(exist_ok=True)
-        
         # Create test files
-        init_file = package_dir / "__init__.py"
-        with open(init_file, "w") as f:
-            f.write('__version__ = "0.1.0"\n')
-        
-        bumpversion_file = tmpdir_path / ".bumpversion.cfg"
-        with open(bumpversion_file, "w") as f:
-            f.write("[bumpversion]\ncurrent_version = 0.1.0\n")
-                
-        # Create a changelog file
-        changelog_file = tmpdir_path / "CHANGELOG.md"
-        with open(changelog_file, "w") as f:
-            f.write("# Changelog\n\n## 0.1.0\n- Initial release\n")
+        files = {
+            "package/__init__.py": '__version__ = "0.1.0"\n',
+            ".bumpversion.cfg": "[bumpversion]\ncurrent_version = 0.1.0\n",
+            "CHANGELOG.md": "# Changelog\n\n## 0.1.0\n- Initial release\n",
+        }
+        for rel, content in files.items():
+            file_path = tmpdir_path / rel
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text(content)
         
         # Verify files were created successfully
-        assert init_file.exists(), f"Failed to create {init_file}"
-        assert bumpversion_file.exists(), f"Failed to create {bumpversion_file}"
-        assert changelog_file.exists(), f"Failed to create {changelog_file}"
+        for rel in files:
+            assert (tmpdir_path / rel).exists(), f"Failed to create {rel}"
         
         # Print the directory structure for debugging
         print(f"Files in {tmpdir_path}:")
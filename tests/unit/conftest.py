@@ -0,0 +1,21 @@
+"""
+Shared pytest configuration for the unit tests.
+"""
+
+from importlib.machinery import PathFinder
+
+
+def _mcp_importable():
+    """Check whether the mcp package is installed, without importing it."""
+    # Search sys.path directly: the integration tests replace sys.modules['mcp']
+    # with a mock, which importlib.util.find_spec would look at instead
+    return PathFinder.find_spec("mcp") is not None
+
+
+# These modules import the package's MCP integrations, which need the mcp
+# package. Without it, ignoring them keeps pytest from importing them at all;
+# a module-level skip would still pay for their imports on every run.
+collect_ignore = [] if _mcp_importable() else [
+    "test_pr_functionality.py",
+    "test_tool_registration.py",
+]
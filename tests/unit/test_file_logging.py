@@ -17,130 +17,95 @@
 Tests for the file logging functionality in the MCP server.
 """
 
+import contextlib
 import os
-import tempfile
 import logging
+import logging.handlers
 import pytest
-from pathlib import Path
+from types import SimpleNamespace
 
 from mcp_server_practices.utils.directory_utils import setup_file_logging, find_project_root
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for testing."""
-    temp_dir = tempfile.mkdtemp()
-    yield temp_dir
-    # Clean up
+@pytest.fixture(scope="session")
+def project_with_marker(tmp_path_factory):
+    """Create a session-wide project directory containing a marker file."""
+    project_dir = tmp_path_factory.mktemp("with_marker")
+    (project_dir / "pyproject.toml").write_text("# Test marker file")
+    # On macOS, the temp dir might resolve differently, so keep both the
+    # path as created and its resolved form
+    path = str(project_dir)
+    return SimpleNamespace(path=path, real=os.path.realpath(path))
+
+
+@pytest.fixture(autouse=True)
+def _clean_root_logger():
+    """Run each test against a root logger with no handlers attached."""
+    root = logging.getLogger()
+    saved = root.handlers[:]
+    root.handlers.clear()
+    yield
+    # Close any handlers the test left behind so file descriptors don't leak
+    for handler in root.handlers:
+        if handler not in saved:
+            handler.close()
+    root.handlers[:] = saved
+
+
+@contextlib.contextmanager
+def attached_handler(logger, handler):
+    """Attach a handler to a logger, detaching and closing it on exit."""
+    logger.addHandler(handler)
     try:
-        for root, dirs, files in os.walk(temp_dir, topdown=False):
-            for file in files:
-                os.remove(os.path.join(root, file))
-            for dir in dirs:
-                os.rmdir(os.path.join(root, dir))
-        os.rmdir(temp_dir)
-    except Exception as e:
-        print(f"Failed to clean up temp directory: {e}")
+        yield handler
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
 
 
 class TestFileLogging:
     """Test cases for file logging functionality."""
 
-    def test_setup_file_logging_default_path(self, temp_dir):
-        """Test setting up file logging with default path."""
-        # Ensure we're using a fresh logger
-        root_logger = logging.getLogger()
-        for handler in root_logger.handlers[:]:
-            root_logger.removeHandler(handler)
-            
-        # Configure basic logging first
-        logging.basicConfig(
-            level=logging.INFO,
-            format='[%(asctime)s] %(levelname)s %(message)s',
-            datefmt='%m/%d/%y %H:%M:%S'
-        )
-        
-        # Set up logging
-        handler = setup_file_logging(
-            logging_level=logging.INFO,
-            project_root=temp_dir
-        )
+    @pytest.mark.parametrize(
+        "level, use_custom_path",
+        [(logging.INFO, False), (logging.DEBUG, True)],
+        ids=["default_path", "custom_path"],
+    )
+    def test_setup_file_logging(self, tmp_path, level, use_custom_path):
+        """Test setting up file logging with the default and a custom path."""
+        # Set up logging, either in the .practices directory or at a custom path
+        if use_custom_path:
+            log_file = tmp_path / "custom" / "logs" / "server.log"
+            handler = setup_file_logging(logging_level=level, log_file_path=str(log_file))
+        else:
+            log_file = tmp_path / ".practices" / "server.log"
+            handler = setup_file_logging(logging_level=level, project_root=str(tmp_path))
 
         # Verify handler was created
         assert handler is not None
         
-        # Verify log file was created in .practices directory
-        practices_dir = os.path.join(temp_dir, ".practices")
-        log_file = os.path.join(practices_dir, "server.log")
-        assert os.path.exists(practices_dir)
-        assert os.path.exists(log_file)
+        # Verify log file was created
+        assert log_file.is_file()
         
         # Create a logger specifically for this test
-        test_logger = logging.getLogger("test_default_path")
-        test_logger.setLevel(logging.INFO)
-        test_logger.addHandler(handler)
-        
-        # Write a log message
-        test_message = "Test log message for default path - unique ID"
-        test_logger.info(test_message)
-        
-        # Force flush the handler to ensure the message is written
-        handler.flush()
-        
-        # Verify message was written to file
-        with open(log_file, 'r') as f:
-            content = f.read()
-            assert test_message in content
-        
-        # Clean up - remove handler to release file
-        logging.getLogger().removeHandler(handler)
-        handler.close()
-
-    def test_setup_file_logging_custom_path(self, temp_dir):
-        """Test setting up file logging with custom path."""
-        # Ensure we're using a fresh logger
-        root_logger = logging.getLogger()
-        for handler in root_logger.handlers[:]:
-            root_logger.removeHandler(handler)
-            
-        # Configure basic logging
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format='[%(asctime)s] %(levelname)s %(message)s',
-            datefmt='%m/%d/%y %H:%M:%S'
+        # (instantiated directly so it is not registered with the logging manager)
+        test_logger = logging.Logger("test_setup_file_logging")
+        test_logger.setLevel(level)
+        # Buffer records in memory and write them to the file in one flush
+        mem_handler = logging.handlers.MemoryHandler(
+            capacity=1024, flushLevel=logging.ERROR, target=handler
         )
-            
-        # Create a custom log path
-        custom_log_path = os.path.join(temp_dir, "custom", "logs", "server.log")
-        
-        # Set up logging
-        handler = setup_file_logging(
-            logging_level=logging.DEBUG,
-            log_file_path=custom_log_path
-        )
-        
-        # Verify handler was created
-        assert handler is not None
-        
-        # Verify log file was created at custom path
-        assert os.path.exists(custom_log_path)
-        
-        # Create a logger specifically for this test
-        test_logger = logging.getLogger("test_custom_path")
-        test_logger.setLevel(logging.DEBUG)
-        test_logger.addHandler(handler)
         
         # Write a log message
-        test_message = "Custom path test message - unique identifier"
-        test_logger.debug(test_message)
-        
-        # Force flush the handler to ensure the message is written
-        handler.flush()
+        test_message = f"Test log message at {logging.getLevelName(level)} - unique ID"
+        with attached_handler(test_logger, mem_handler):
+            test_logger.log(level, test_message)
+            
+            # Force flush the buffer to ensure the message is written
+            mem_handler.flush()
         
         # Verify message was written to file
-        with open(custom_log_path, 'r') as f:
-            content = f.read()
-            assert test_message in content
+        assert test_message.encode() in log_file.read_bytes()
         
         # Clean up - remove handler to release file
         logging.getLogger().removeHandler(handler)
@@ -163,32 +128,22 @@ class TestFileLogging:
         # Verify handler is None due to the error
         assert handler is None
 
-    def test_find_project_root_with_marker(self, temp_dir):
+    def test_find_project_root_with_marker(self, project_with_marker):
         """Test finding project root with a marker file."""
-        # Create a marker file
-        marker_path = os.path.join(temp_dir, "pyproject.toml")
-        with open(marker_path, 'w') as f:
-            f.write("# Test marker file")
-        
         # Find project root
-        root = find_project_root(temp_dir)
-        
-        # On macOS, temp_dir might resolve differently, so we should check
-        # that the returned path contains the expected path, or is the resolved version
-        # of the expected path
-        real_temp_dir = os.path.realpath(temp_dir)
+        root = find_project_root(project_with_marker.path)
         
         # Verify either paths are equal or resolved paths are equal
-        assert root == temp_dir or root == real_temp_dir
+        assert root in (project_with_marker.path, project_with_marker.real)
 
-    def test_find_project_root_no_marker(self, temp_dir):
+    def test_find_project_root_no_marker(self, tmp_path):
         """Test finding project root without a marker file."""
         # Find project root from a subdirectory
-        subdir = os.path.join(temp_dir, "subdir")
-        os.makedirs(subdir, exist_ok=True)
+        subdir = tmp_path / "subdir"
+        subdir.mkdir(exist_ok=True)
         
         # Find project root - should return the subdir since no markers are found
-        root = find_project_root(subdir)
+        root = find_project_root(str(subdir))
         
         # Without markers, it should return the start path
-        assert root == subdir
+        assert root == str(subdir)
@@ -8,66 +8,116 @@ Copyright (c) 2025 Agentience.ai
 License: MIT License - See LICENSE file for details
 """
 
-import unittest
-import sys
-import os
-from unittest.mock import patch, MagicMock, Mock
-
-# Mock the mcp module since we don't have the actual SDK installed
-sys.modules['mcp'] = Mock()
-sys.modules['mcp.tools'] = Mock()
-sys.modules['mcp.tools'].call_tool = Mock()
-
-# Add src to Python path to find module
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src')))
-
 import pytest
 
 pytest.skip("Skipping GitHub integration tests due to MCP package dependency issues", allow_module_level=True)
 
+from types import MappingProxyType
+from unittest.mock import patch, Mock, MagicMock
+
 from mcp_server_practices.integrations.github import (
     GitHubAdapter, get_repository_info, create_branch,
     create_pull_request, get_file_contents, update_file
 )
 
 
-class TestGitHubAdapter(unittest.TestCase):
+# Shared, read-only adapter configuration
+_CONFIG = MappingProxyType({
+    "github": {
+        "repository": {
+            "owner": "agentience",
+            "name": "mcp_server_practices"
+        },
+        "features": {
+            "create_pr": True,
+            "auto_merge": False
+        },
+        "ci": {
+            "required_checks": ["tests", "lint"],
+            "wait_for_checks": True
+        }
+    }
+})
+
+# Expected call_tool arguments, built once at import
+_GET_REPOSITORY_ARGS = MappingProxyType({
+    "owner": "agentience",
+    "repo": "mcp_server_practices"
+})
+_CREATE_BRANCH_ARGS = MappingProxyType({
+    "owner": "agentience",
+    "repo": "mcp_server_practices",
+    "branch": "feature/test-branch",
+    "from_branch": "main"
+})
+_CREATE_PULL_REQUEST_ARGS = MappingProxyType({
+    "owner": "agentience",
+    "repo": "mcp_server_practices",
+    "title": "Add feature",
+    "body": "This PR adds a new feature",
+    "head": "feature/new-feature",
+    "base": "main",
+    "draft": False
+})
+_GET_FILE_CONTENTS_ARGS = MappingProxyType({
+    "owner": "agentience",
+    "repo": "mcp_server_practices",
+    "path": "README.md"
+})
+_UPDATE_FILE_ARGS = MappingProxyType({
+    "owner": "agentience",
+    "repo": "mcp_server_practices",
+    "path": "README.md",
+    "message": "Update README",
+    "content": "new content",
+    "branch": "main",
+    "sha": "abc123"
+})
+
+# Single call_tool mock reused by every test and reset in between
+_MOCK_CALL_TOOL = MagicMock()
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_call_tool():
+    """Reset the shared call_tool mock before each test."""
+    _MOCK_CALL_TOOL.reset_mock(return_value=True, side_effect=True)
+    yield
+
+
+class TestGitHubAdapter:
     """Test case for the GitHub adapter."""
 
-    def setUp(self):
+    @classmethod
+    def setup_class(cls):
+        """Create the adapter shared by every test in the class."""
+        cls.adapter = GitHubAdapter(_CONFIG)
+
+    def setup_method(self):
         """Set up test fixtures."""
-        self.config = {
-            "github": {
-                "repository": {
-                    "owner": "agentience",
-                    "name": "mcp_server_practices"
-                },
-                "features": {
-                    "create_pr": True,
-                    "auto_merge": False
-                },
-                "ci": {
-                    "required_checks": ["tests", "lint"],
-                    "wait_for_checks": True
-                }
-            }
-        }
-        self.adapter = GitHubAdapter(self.config)
+        # Patch call_tool once per test instead of decorating every method
+        self.patcher = patch(
+            "mcp_server_practices.integrations.github.call_tool", _MOCK_CALL_TOOL
+        )
+        self.mock_call_tool = self.patcher.start()
+
+    def teardown_method(self):
+        """Remove the call_tool patch."""
+        self.patcher.stop()
 
     def test_init(self):
         """Test adapter initialization."""
-        self.assertEqual(self.adapter.default_owner, "agentience")
-        self.assertEqual(self.adapter.default_repo, "mcp_server_practices")
-        self.assertTrue(self.adapter.create_pr_enabled)
-        self.assertFalse(self.adapter.auto_merge_enabled)
-        self.assertEqual(self.adapter.required_checks, ["tests", "lint"])
-        self.assertTrue(self.adapter.wait_for_checks)
+        assert self.adapter.default_owner == "agentience"
+        assert self.adapter.default_repo == "mcp_server_practices"
+        assert self.adapter.create_pr_enabled
+        assert not self.adapter.auto_merge_enabled
+        assert self.adapter.required_checks == ["tests", "lint"]
+        assert self.adapter.wait_for_checks
 
-    @patch("mcp_server_practices.integrations.github.call_tool")
-    def test_get_repository_info(self, mock_call_tool):
+    def test_get_repository_info(self):
         """Test get_repository_info method."""
         # Mock the GitHub MCP tool response
-        mock_call_tool.return_value = {
+        self.mock_call_tool.return_value = {
             "description": "A test repository",
             "default_branch": "main",
             "stargazers_count": 42,
@@ -79,30 +129,24 @@ class TestGitHubAdapter(unittest.TestCase):
         result = self.adapter.get_repository_info("agentience", "mcp_server_practices")
 
         # Verify the result
-        self.assertTrue(result["success"])
-        self.assertEqual(result["owner"], "agentience")
-        self.assertEqual(result["repo"], "mcp_server_practices")
-        self.assertEqual(result["repository"]["description"], "A test repository")
+        assert result["success"]
+        assert result["owner"] == "agentience"
+        assert result["repo"] == "mcp_server_practices"
+        assert result["repository"]["description"] == "A test repository"
 
         # Verify the call_tool was called with the correct arguments
-        mock_call_tool.assert_called_once_with(
-            "github",
-            "get_repository",
-            {
-                "owner": "agentience",
-                "repo": "mcp_server_practices"
-            }
+        self.mock_call_tool.assert_called_once_with(
+            "github", "get_repository", _GET_REPOSITORY_ARGS
         )
 
-    @patch("mcp_server_practices.integrations.github.call_tool")
-    def test_create_branch(self, mock_call_tool):
+    def test_create_branch(self):
         """Test create_branch method."""
         # Mock the branch_exists method
         with patch.object(self.adapter, "branch_exists") as mock_branch_exists:
             mock_branch_exists.return_value = {"exists": False}
             
             # Mock the GitHub MCP tool response
-            mock_call_tool.return_value = {"ref": "refs/heads/feature/test-branch"}
+            self.mock_call_tool.return_value = {"ref": "refs/heads/feature/test-branch"}
             
             # Call the method
             result = self.adapter.create_branch(
@@ -110,27 +154,19 @@ class TestGitHubAdapter(unittest.TestCase):
             )
             
             # Verify the result
-            self.assertTrue(result["success"])
-            self.assertEqual(result["branch_name"], "feature/test-branch")
-            self.assertEqual(result["base_branch"], "main")
+            assert result["success"]
+            assert result["branch_name"] == "feature/test-branch"
+            assert result["base_branch"] == "main"
             
             # Verify the call_tool was called with the correct arguments
-            mock_call_tool.assert_called_once_with(
-                "github",
-                "create_branch",
-                {
-                    "owner": "agentience",
-                    "repo": "mcp_server_practices",
-                    "branch": "feature/test-branch",
-                    "from_branch": "main"
-                }
+            self.mock_call_tool.assert_called_once_with(
+                "github", "create_branch", _CREATE_BRANCH_ARGS
             )
 
-    @patch("mcp_server_practices.integrations.github.call_tool")
-    def test_create_pull_request(self, mock_call_tool):
+    def test_create_pull_request(self):
         """Test create_pull_request method."""
         # Mock the GitHub MCP tool response
-        mock_call_tool.return_value = {
+        self.mock_call_tool.return_value = {
             "number": 123,
             "html_url": "https://github.com/agentience/mcp_server_practices/pull/123"
         }
@@ -143,30 +179,19 @@ class TestGitHubAdapter(unittest.TestCase):
         )
         
         # Verify the result
-        self.assertTrue(result["success"])
-        self.assertEqual(result["pr_number"], 123)
-        self.assertEqual(result["html_url"], "https://github.com/agentience/mcp_server_practices/pull/123")
+        assert result["success"]
+        assert result["pr_number"] == 123
+        assert result["html_url"] == "https://github.com/agentience/mcp_server_practices/pull/123"
         
         # Verify the call_tool was called with the correct arguments
-        mock_call_tool.assert_called_once_with(
-            "github",
-            "create_pull_request",
-            {
-                "owner": "agentience",
-                "repo": "mcp_server_practices",
-                "title": "Add feature",
-                "body": "This PR adds a new feature",
-                "head": "feature/new-feature",
-                "base": "main",
-                "draft": False
-            }
+        self.mock_call_tool.assert_called_once_with(
+            "github", "create_pull_request", _CREATE_PULL_REQUEST_ARGS
         )
 
-    @patch("mcp_server_practices.integrations.github.call_tool")
-    def test_get_file_contents(self, mock_call_tool):
+    def test_get_file_contents(self):
         """Test get_file_contents method."""
         # Mock the GitHub MCP tool response
-        mock_call_tool.return_value = {
+        self.mock_call_tool.return_value = {
             "content": "file content here",
             "sha": "abc123"
         }
@@ -177,26 +202,19 @@ class TestGitHubAdapter(unittest.TestCase):
         )
         
         # Verify the result
-        self.assertTrue(result["success"])
-        self.assertEqual(result["content"], "file content here")
-        self.assertEqual(result["sha"], "abc123")
+        assert result["success"]
+        assert result["content"] == "file content here"
+        assert result["sha"] == "abc123"
         
         # Verify the call_tool was called with the correct arguments
-        mock_call_tool.assert_called_once_with(
-            "github",
-            "get_file_contents",
-            {
-                "owner": "agentience",
-                "repo": "mcp_server_practices",
-                "path": "README.md"
-            }
+        self.mock_call_tool.assert_called_once_with(
+            "github", "get_file_contents", _GET_FILE_CONTENTS_ARGS
         )
 
-    @patch("mcp_server_practices.integrations.github.call_tool")
-    def test_update_file(self, mock_call_tool):
+    def test_update_file(self):
         """Test update_file method."""
         # Mock the GitHub MCP tool response
-        mock_call_tool.return_value = {
+        self.mock_call_tool.return_value = {
             "commit": {
                 "sha": "def456",
                 "message": "Update file"
@@ -211,27 +229,16 @@ class TestGitHubAdapter(unittest.TestCase):
         )
         
         # Verify the result
-        self.assertTrue(result["success"])
-        self.assertEqual(result["path"], "README.md")
-        self.assertEqual(result["branch"], "main")
+        assert result["success"]
+        assert result["path"] == "README.md"
+        assert result["branch"] == "main"
         
         # Verify the call_tool was called with the correct arguments
-        mock_call_tool.assert_called_once_with(
-            "github",
-            "create_or_update_file",
-            {
-                "owner": "agentience",
-                "repo": "mcp_server_practices",
-                "path": "README.md",
-                "message": "Update README",
-                "content": "new content",
-                "branch": "main",
-                "sha": "abc123"
-            }
+        self.mock_call_tool.assert_called_once_with(
+            "github", "create_or_update_file", _UPDATE_FILE_ARGS
         )
 
-    @patch("mcp_server_practices.integrations.github.call_tool")
-    def test_workflow_status(self, mock_call_tool):
+    def test_workflow_status(self):
         """Test get_workflow_status method."""
         # Set up mock responses
         mock_branch_result = {
@@ -243,14 +250,13 @@ class TestGitHubAdapter(unittest.TestCase):
         ]
         
         # Configure the mock to return different values based on arguments
-        def side_effect(*args, **kwargs):
-            if args[0] == "github" and args[1] == "get_branch":
-                return mock_branch_result
-            elif args[0] == "github" and args[1] == "list_pull_requests":
-                return mock_prs
-            return {}
-        
-        mock_call_tool.side_effect = side_effect
+        responses = {
+            ("github", "get_branch"): mock_branch_result,
+            ("github", "list_pull_requests"): mock_prs,
+        }
+        self.mock_call_tool.side_effect = lambda *args, **kwargs: responses.get(
+            (args[0], args[1]), {}
+        )
         
         # Call the method with a branch
         result = self.adapter.get_workflow_status(
@@ -258,19 +264,19 @@ class TestGitHubAdapter(unittest.TestCase):
         )
         
         # Verify the result
-        self.assertTrue(result["success"])
-        self.assertEqual(result["branch"], mock_branch_result)
-        self.assertEqual(result["pull_requests"], mock_prs)
+        assert result["success"]
+        assert result["branch"] == mock_branch_result
+        assert result["pull_requests"] == mock_prs
 
 
-class TestStandaloneFunctions(unittest.TestCase):
+class TestStandaloneFunctions:
     """Test standalone functions in the github module."""
 
     @patch("mcp_server_practices.integrations.github.GitHubAdapter")
     def test_get_repository_info_function(self, mock_adapter_class):
         """Test the get_repository_info standalone function."""
         # Set up the mock
-        mock_adapter = MagicMock()
+        mock_adapter = Mock(spec=GitHubAdapter)
         mock_adapter.get_repository_info.return_value = {"success": True, "repository": {}}
         mock_adapter_class.return_value = mock_adapter
         
@@ -278,14 +284,14 @@ class TestStandaloneFunctions(unittest.TestCase):
         result = get_repository_info("agentience", "mcp_server_practices")
         
         # Verify the result
-        self.assertEqual(result, {"success": True, "repository": {}})
+        assert result == {"success": True, "repository": {}}
         mock_adapter.get_repository_info.assert_called_once_with("agentience", "mcp_server_practices")
 
     @patch("mcp_server_practices.integrations.github.GitHubAdapter")
     def test_create_branch_function(self, mock_adapter_class):
         """Test the create_branch standalone function."""
         # Set up the mock
-        mock_adapter = MagicMock()
+        mock_adapter = Mock(spec=GitHubAdapter)
         mock_adapter.create_branch.return_value = {"success": True}
         mock_adapter_class.return_value = mock_adapter
         
@@ -293,11 +299,7 @@ class TestStandaloneFunctions(unittest.TestCase):
         result = create_branch("agentience", "mcp_server_practices", "feature/test", "main")
         
         # Verify the result
-        self.assertEqual(result, {"success": True})
+        assert result == {"success": True}
         mock_adapter.create_branch.assert_called_once_with(
             "agentience", "mcp_server_practices", "feature/test", "main"
         )
-
-
-if __name__ == "__main__":
-    unittest.main()
@@ -9,22 +9,27 @@ License: MIT License - See LICENSE file for details
 Version: 0.1.0
 """
 
-import os
-import sys
-import tempfile
+import stat
+import subprocess
 import time
 import unittest
 from unittest import mock
 
 import pytest
 
-# Add src directory to path to allow imports to work
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
-
+from mcp_server_practices.hooks import installer
 from mcp_server_practices.hooks.installer import check_git_repo_init, install_hooks, update_hooks
 from mcp_server_practices.hooks.templates import get_default_config
 
 
+@pytest.fixture(autouse=True)
+def _clear_repo_cache():
+    """Start every test with an empty repository check cache."""
+    installer._repo_cache.clear()
+    yield
+    installer._repo_cache.clear()
+
+
 class TestHooksInstaller:
     """Tests for the hooks installer module."""
 
@@ -47,10 +52,10 @@ class TestHooksInstaller:
         assert "eslint" in js_config
         assert "prettier" in js_config
 
-    @mock.patch("os.path.isdir")
-    def test_check_git_repo_init_not_a_repo(self, mock_isdir):
+    @mock.patch("os.stat")
+    def test_check_git_repo_init_not_a_repo(self, mock_stat):
         """Test checking a non-git repository."""
-        mock_isdir.return_value = False
+        mock_stat.side_effect = FileNotFoundError
 
         result = check_git_repo_init("/path/to/repo")
         
@@ -58,20 +63,19 @@ class TestHooksInstaller:
         assert result["initialized"] is False
         assert "Not a Git repository" in result["error"]
 
-    @mock.patch("os.path.isdir")
-    @mock.patch("os.path.getctime")
+    @mock.patch("os.stat")
     @mock.patch("time.time")
     @mock.patch("subprocess.run")
-    def test_check_git_repo_init_newly_initialized(self, mock_run, mock_time, mock_getctime, mock_isdir):
+    def test_check_git_repo_init_newly_initialized(self, mock_run, mock_time, mock_stat):
         """Test checking a newly initialized git repository."""
-        mock_isdir.return_value = True
-        mock_getctime.return_value = 1000  # Git dir creation time
+        # Git dir creation time
+        mock_stat.return_value = mock.Mock(st_mode=stat.S_IFDIR, st_ctime=1000)
         mock_time.return_value = 1100  # Current time (less than 5 minutes later)
         
         # Mock subprocess.run result for getting default branch
         mock_process = mock.Mock()
         mock_process.returncode = 0
-        mock_process.stdout = "main\n"
+        mock_process.stdout = b"main\n"
         mock_run.return_value = mock_process
 
         result = check_git_repo_init("/path/to/repo")
@@ -81,20 +85,19 @@ class TestHooksInstaller:
         assert result["is_newly_initialized"] is True
         assert result["default_branch"] == "main"
 
-    @mock.patch("os.path.isdir")
-    @mock.patch("os.path.getctime")
+    @mock.patch("os.stat")
     @mock.patch("time.time")
     @mock.patch("subprocess.run")
-    def test_check_git_repo_init_existing_repo(self, mock_run, mock_time, mock_getctime, mock_isdir):
+    def test_check_git_repo_init_existing_repo(self, mock_run, mock_time, mock_stat):
         """Test checking an existing git repository."""
-        mock_isdir.return_value = True
-        mock_getctime.return_value = 1000  # Git dir creation time
+        # Git dir creation time
+        mock_stat.return_value = mock.Mock(st_mode=stat.S_IFDIR, st_ctime=1000)
         mock_time.return_value = 1500  # Current time (more than 5 minutes later)
         
         # Mock subprocess.run result for getting default branch
         mock_process = mock.Mock()
         mock_process.returncode = 0
-        mock_process.stdout = "main\n"
+        mock_process.stdout = b"main\n"
         mock_run.return_value = mock_process
 
         result = check_git_repo_init("/path/to/repo")
@@ -104,6 +107,31 @@ class TestHooksInstaller:
         assert result["is_newly_initialized"] is False
         assert result["default_branch"] == "main"
 
+    @mock.patch("os.stat")
+    @mock.patch("time.time")
+    @mock.patch("subprocess.run")
+    def test_check_git_repo_init_cached(self, mock_run, mock_time, mock_stat):
+        """Test that repeated checks of the same repository reuse the result."""
+        mock_stat.return_value = mock.Mock(st_mode=stat.S_IFDIR, st_ctime=1000)
+        mock_time.return_value = 1500
+        mock_run.return_value = mock.Mock(returncode=0, stdout=b"main\n")
+
+        first = check_git_repo_init("/path/to/repo")
+        second = check_git_repo_init("/path/to/repo")
+        
+        assert first == second
+        assert mock_run.call_count == 1
+        
+        # Once the entry expires the repository is checked again
+        mock_time.return_value = 1500 + installer._REPO_CACHE_TTL
+        check_git_repo_init("/path/to/repo")
+        assert mock_run.call_count == 2
+
+        # Caching another path removes entries that have expired
+        mock_time.return_value = 1500 + 2 * installer._REPO_CACHE_TTL
+        check_git_repo_init("/path/to/other")
+        assert set(installer._repo_cache) == {"/path/to/other"}
+
     @mock.patch("mcp_server_practices.hooks.installer.check_git_repo_init")
     @mock.patch("subprocess.run")
     @mock.patch("os.path.exists")
@@ -122,12 +150,13 @@ class TestHooksInstaller:
         mock_exists.return_value = False
         
         # Mock subprocess.run for pip install and pre-commit install
-        mock_run.return_value = mock.Mock(returncode=0, stdout="Hooks installed successfully")
+        mock_run.return_value = mock.Mock(returncode=0, stdout=b"Hooks installed successfully")
         
         result = install_hooks("/path/to/repo")
         
         assert result["success"] is True
         assert "installed successfully" in result["message"]
+        assert result["output"] == "Hooks installed successfully"
         
         # Verify the config file was created
         mock_open.assert_called_once()
@@ -136,8 +165,8 @@ class TestHooksInstaller:
         mock_run.assert_called_with(
             ["pre-commit", "install"],
             cwd="/path/to/repo",
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             check=True
         )
 
@@ -173,19 +202,20 @@ class TestHooksInstaller:
         mock_exists.return_value = True
         
         # Mock subprocess.run for autoupdate
-        mock_run.return_value = mock.Mock(returncode=0, stdout="Hooks updated successfully")
+        mock_run.return_value = mock.Mock(returncode=0, stdout=b"Hooks updated successfully")
         
         result = update_hooks("/path/to/repo")
         
         assert result["success"] is True
         assert "updated successfully" in result["message"]
+        assert result["output"] == "Hooks updated successfully"
         
         # Verify pre-commit autoupdate was called
         mock_run.assert_called_with(
             ["pre-commit", "autoupdate"],
             cwd="/path/to/repo",
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             check=True
         )
 
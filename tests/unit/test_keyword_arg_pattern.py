@@ -19,9 +19,9 @@ class TestKeywordOnlyPattern(unittest.TestCase):
         sig = inspect.signature(test_func)
         
         # Check that all parameters are keyword-only
-        for name, param in sig.parameters.items():
-            self.assertEqual(param.kind, inspect.Parameter.KEYWORD_ONLY,
-                          f"Parameter {name} is not keyword-only")
+        kinds = {param.kind for param in sig.parameters.values()}
+        self.assertEqual(kinds, {inspect.Parameter.KEYWORD_ONLY},
+                         "Not all parameters are keyword-only")
         
         # Verify the correct parameter names and defaults
         self.assertIn('arg1', sig.parameters)
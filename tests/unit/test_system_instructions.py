@@ -1,29 +1,25 @@
 """
 Unit tests for system instructions handling.
 """
-import pytest
-
-pytest.skip("Skipping system instructions tests due to MCP package dependency issues", allow_module_level=True)
-
 import os
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
 
-# Add pytest_asyncio for handling async tests
-import pytest_asyncio
+from mcp_server_practices.utils import directory_utils
+from mcp_server_practices.utils.directory_utils import get_system_instructions
 
-from mcp_server_practices.mcp_server import get_system_instructions
+# Repository root, resolved once for the module
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Bundled system instructions template, read once for the module
+TEMPLATE_PATH = PROJECT_ROOT / "src" / "mcp_server_practices" / "templates" / "system_instructions.md"
+TEMPLATE_BYTES = TEMPLATE_PATH.read_bytes() if TEMPLATE_PATH.exists() else None
 
 
 @pytest.fixture
-def temp_project_dir():
-    """Create a temporary directory to simulate a project root."""
-    temp_dir = tempfile.mkdtemp()
-    yield temp_dir
-    # Clean up after test
-    shutil.rmtree(temp_dir)
+def temp_project_dir(tmp_path):
+    """Provide a temporary directory to simulate a project root."""
+    return str(tmp_path)
 
 
 @pytest.mark.asyncio
@@ -42,6 +38,26 @@ async def test_get_system_instructions_creates_default_file(temp_project_dir):
     
     assert os.path.exists(practices_dir)
     assert os.path.exists(system_instructions_path)
+    
+    # The template is copied byte for byte
+    with open(system_instructions_path, "rb") as f:
+        assert f.read() == TEMPLATE_BYTES
+
+
+@pytest.mark.asyncio
+async def test_get_system_instructions_retries_failed_template_read(tmp_path, monkeypatch):
+    """Test that a failed template read is not cached."""
+    directory_utils._load_default_template.cache_clear()
+    
+    # An unreadable template falls back to the basic instructions
+    with monkeypatch.context() as m:
+        m.setattr(directory_utils, "DEFAULT_INSTRUCTIONS_PATH", tmp_path / "missing.md")
+        instructions = await get_system_instructions(str(tmp_path / "first"))
+    assert "## Available MCP Tools" not in instructions
+    
+    # Once the template is readable again, the next project gets it
+    instructions = await get_system_instructions(str(tmp_path / "second"))
+    assert instructions.encode() == TEMPLATE_BYTES
 
 
 @pytest.mark.asyncio
@@ -67,17 +83,9 @@ async def test_get_system_instructions_uses_existing_file(temp_project_dir):
 
 def test_system_instructions_template_exists():
     """Test that the system instructions template file exists."""
-    # Get the location of the mcp_server.py file
-    mcp_server_path = Path(__file__).parent.parent.parent / "src" / "mcp_server_practices" / "mcp_server.py"
-    template_path = Path(mcp_server_path).parent / "templates" / "system_instructions.md"
-    
-    assert template_path.exists()
-    
-    # Read the template file
-    with open(template_path, 'r') as f:
-        content = f.read()
+    assert TEMPLATE_BYTES is not None
     
     # Verify it contains expected content
-    assert "# Practices MCP Server - System Instructions" in content
-    assert "## Available MCP Tools" in content
-    assert "## Development Practices Guidelines" in content
+    assert b"# Practices MCP Server - System Instructions" in TEMPLATE_BYTES
+    assert b"## Available MCP Tools" in TEMPLATE_BYTES
+    assert b"## Development Practices Guidelines" in TEMPLATE_BYTES
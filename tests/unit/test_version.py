@@ -1,12 +1,18 @@
 """Tests for the version module."""
 
-import pytest
+import configparser
+from pathlib import Path
 
 from mcp_server_practices import __version__
 
+# bumpversion rewrites __version__ from this file, so it is the source of truth
+BUMPVERSION_CFG = Path(__file__).parents[2] / ".bumpversion.cfg"
+
 
 def test_version():
-    """Test that version is a string."""
+    """Test that version is a string matching the bumpversion configuration."""
     assert isinstance(__version__, str)
-    # Version has been updated from 0.2.0 to 0.4.0
-    assert __version__ == "0.4.0"
+
+    config = configparser.ConfigParser()
+    config.read(BUMPVERSION_CFG)
+    assert __version__ == config["bumpversion"]["current_version"]